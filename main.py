@@ -1,21 +1,37 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
+import asyncio
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import logging
+import multiprocessing
 import os
+import pickle
 import re
+import threading
 import time
 import traceback
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse, urljoin, urlunparse
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Comment
+from pybloom_live import ScalableBloomFilter
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
@@ -31,10 +47,557 @@ USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 11_4) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
 ]
 
+CHROMEDRIVER_PATH = '/usr/local/bin/chromedriver'
+
+# Recursos bloqueados no navegador: não contribuem para o texto extraído
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm',
+]
+
+# Antes de navegar, o documento atual da aba é marcado; o novo documento não
+# terá a marca, o que distingue a página nova da anterior
+MARK_STALE_SCRIPT = "window.__stale = true;"
+
+# Página pronta: documento novo carregado e nenhum recurso com resposta pendente
+PAGE_READY_SCRIPT = (
+    "return !window.__stale && document.readyState === 'complete' && "
+    "window.performance.getEntriesByType('resource').filter(r => r.responseEnd === 0).length === 0"
+)
+
+# HTML da página, ou null se a navegação ainda não substituiu o documento anterior
+PAGE_SOURCE_SCRIPT = "return window.__stale ? null : document.documentElement.outerHTML;"
+
+# Número de elementos do documento novo, usado para detectar quando o DOM para de crescer
+DOM_SIZE_SCRIPT = "return window.__stale ? null : document.getElementsByTagName('*').length;"
+
+# Registrado em cada aba via CDP; o V8 compila a função uma vez por documento.
+# A cada chamada rola uma tela e retorna [rolou, chegou ao fim]
+SCROLL_HELPER_SCRIPT = (
+    "window.__scroll = () => {"
+    " const y = window.scrollY; window.scrollBy(0, window.innerHeight);"
+    " return [window.scrollY !== y,"
+    " window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 1]; };"
+)
+
+# Esquemas de links que não levam a páginas rastreáveis
+NON_PAGE_SCHEMES = ('mailto:', 'tel:', 'javascript:', 'data:')
+
+# Uma página obtida via requests é usada sem renderização se tiver texto suficiente
+# no <body> e no máximo esta proporção de código de script em relação ao texto
+STATIC_MIN_TEXT_LENGTH = 500
+STATIC_MAX_SCRIPT_RATIO = 3
+# Páginas maiores que isto (em bytes) não são baixadas via requests
+STATIC_MAX_BYTES = 5 * 1024 * 1024
+
+# Tags removidas antes da conversão para Markdown
+DEFAULT_IGNORED_TAGS = ['script', 'style', 'meta', 'link', 'img', 'svg', 'header', 'footer', 'nav']
+
+# Padrões de regex para capturar preços, compilados uma única vez
+PRICE_PATTERNS = [
+    re.compile(r'((?:R\$|€|\$)\s*\d{1,3}(?:\.\d{3})*(?:,\d{2})?)'),
+    re.compile(r'((?:R\$|€|\$)\s*\d+(?:,\d{2})?)'),
+    re.compile(r'(\d+(?:,\d{2})?\s*(?:R\$|€|\$))')
+]
+_RE_CURRENCY_PREFIX = re.compile(r'^(?:R\$|€|\$)')
+
+# Charset declarado no próprio HTML (<meta charset> ou http-equiv)
+_RE_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# Categorias de preço com palavras-chave
+PRICE_CATEGORIES = {
+    'À Vista': ('à vista', 'avista', 'vista', 'cash', 'dinheiro', 'boleto'),
+    'Parcelado': ('parcelado', 'parcela', 'x de', 'parcelas', 'installment'),
+    'Promocional': ('promo', 'desconto', 'oferta', 'sale', 'discount'),
+    'Original': ('original', 'preço original', 'preço cheio'),
+    'Assinatura': ('mensalidade', 'assinatura', 'subscription', 'monthly'),
+    'Atacado': ('atacado', 'wholesale', 'quantidade'),
+    'Internacional': ('internacional', 'dollar', 'euro')
+}
+
+# Seletores de elementos com preços, unidos em uma lista de seletores: a árvore é
+# percorrida uma vez e cada elemento aparece uma só vez, em ordem de documento
+PRICE_SELECTOR = ', '.join([
+    'span.price', 'div.price', 'p.price',
+    '.product-price', '.item-price', '.sale-price',
+    '[data-price]', '[class*="price"]', '[id*="price"]'
+])
+
+# Estado compartilhado por todas as instâncias do crawler no processo: robots.txt
+# já obtidos e último acesso a cada host valem para qualquer domínio rastreado
+_ROBOTS_CACHE = OrderedDict()  # {host: (parser ou None, fetched_at)}
+_HOST_ACCESS = {}  # {host: timestamp}
+_STATE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8192)
+def _cached_urlparse(url):
+    """
+    Versão memoizada de urlparse: a mesma URL é analisada em várias etapas do rastreamento.
+
+    Args:
+        url: URL para analisar
+
+    Returns:
+        ParseResult: Componentes da URL (imutável, seguro para compartilhar)
+    """
+    return urlparse(url)
+
+
+def _decode_html(content, charset=None):
+    """
+    Decodifica o HTML baixado, como o navegador faria.
+
+    Usa o charset do cabeçalho HTTP, depois o declarado no <meta> da página e,
+    por fim, UTF-8 ou windows-1252 (o padrão dos navegadores para páginas legadas).
+
+    Args:
+        content (bytes): Corpo da resposta
+        charset (str, optional): Charset informado no cabeçalho Content-Type
+
+    Returns:
+        str: HTML decodificado
+    """
+    candidates = [charset]
+    match = _RE_META_CHARSET.search(content, 0, 4096)
+    if match:
+        candidates.append(match.group(1).decode('ascii', 'ignore'))
+
+    for encoding in filter(None, candidates):
+        try:
+            return content.decode(encoding, errors='replace')
+        except LookupError:
+            continue
+
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return content.decode('windows-1252', errors='replace')
+
+
+def _normalize_path(path):
+    """
+    Normaliza o caminho da URL.
+
+    Args:
+        path (str): Caminho da URL
+
+    Returns:
+        str: Caminho normalizado
+    """
+    # Remove barras duplas
+    path = path.replace('//', '/')
+
+    # Remove barras no início e no final
+    path = path.strip('/')
+
+    return path
+
+
+def _normalize_url(url, base_url=None):
+    """
+    Normaliza URLs para evitar duplicações.
+
+    Args:
+        url (str): URL para normalizar
+        base_url (str, optional): URL base para resolução de URLs relativas
+
+    Returns:
+        str: URL normalizada, ou None para links que não levam a outra página
+    """
+    # Âncoras na própria página e links mailto:, tel: etc.
+    if not url or url.startswith('#') or url.lower().startswith(NON_PAGE_SCHEMES):
+        return None
+
+    # Resolve URL relativa se base_url for fornecida; urljoin só é necessário
+    # para caminhos relativos, com segmentos "." e ".." ou com tabs e quebras
+    # de linha, que o urljoin descarta antes de resolver o caminho
+    if base_url:
+        if '/.' in url or '\t' in url or '\n' in url or '\r' in url:
+            url = urljoin(base_url, url)
+        elif url.startswith(('http://', 'https://')):
+            # Autoridade vazia (https:///x, https://?q) é resolvida sobre o host da base
+            if url.partition('://')[2][:1] in ('', '/', '?', '#'):
+                url = urljoin(base_url, url)
+        elif url.startswith('/') and not url.startswith('//'):
+            parsed_base = _cached_urlparse(base_url)
+            url = f"{parsed_base.scheme}://{parsed_base.netloc}{url}"
+        else:
+            url = urljoin(base_url, url)
+
+    # Remove fragmentos
+    return _canonicalize_url(url.partition('#')[0])
+
+
+@functools.lru_cache(maxsize=16384)
+def _canonicalize_url(url):
+    """
+    Normaliza uma URL já resolvida e sem fragmento.
+
+    Memoizada pela URL absoluta: links de menus e rodapés se repetem em todas as
+    páginas e, uma vez resolvidos, caem sempre na mesma entrada do cache.
+
+    Args:
+        url (str): URL absoluta, sem fragmento
+
+    Returns:
+        str: URL normalizada
+    """
+    # URL já canônica, o caso mais comum: https, sem www., sem barras duplas ou
+    # final e sem caracteres que o urlparse descartaria; dispensa o ciclo parse/unparse
+    if (url.startswith('https://') and not url.startswith('https://www.') and
+            '//' not in url[8:] and '/?' not in url and ';' not in url and
+            not url.endswith(('/', '?')) and url.isprintable()):
+        return url
+
+    # Parseia a URL
+    parsed_url = urlparse(url)
+
+    # Padroniza o protocolo (https) e remove o www. do host, se presente
+    scheme = 'https' if parsed_url.scheme == 'http' else parsed_url.scheme
+    netloc = parsed_url.netloc
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+
+    # Normaliza o caminho
+    normalized_path = _normalize_path(parsed_url.path)
+    normalized_url = urlunparse(parsed_url._replace(scheme=scheme, netloc=netloc, path=normalized_path))
+
+    # Remove a barra final, se existir, exceto para URLs raiz
+    if normalized_url.endswith('/') and normalized_url != f"{scheme}://{netloc}/":
+        normalized_url = normalized_url.rstrip('/')
+
+    return normalized_url
+
+
+@functools.lru_cache(maxsize=16384)
+def _should_exclude(url, exclude_rules):
+    """
+    Verifica se uma URL deve ser excluída com base nos padrões de exclusão.
+
+    Os padrões são literais, então bastam buscas de substring e um endswith
+    com tupla, feitos em C, sem passar pelo motor de regex. Memoizada: links de
+    menus e rodapés chegam a cada página processada pelo mesmo processo.
+
+    Args:
+        url: A URL para verificar
+        exclude_rules: Tupla (trechos de caminho, extensões) dos padrões de exclusão
+
+    Returns:
+        bool: True se a URL deve ser excluída
+    """
+    fragments, extensions = exclude_rules
+    lowered = url.lower()
+
+    if lowered.endswith(extensions):
+        return True
+    for fragment in fragments:
+        if fragment in lowered:
+            return True
+    return False
+
+
+def _extract_links(tree, base_url, exclude_rules=None):
+    """
+    Extrai, normaliza e aplica os padrões de exclusão aos links de uma página HTML.
+
+    Os hrefs vêm direto da árvore do selectolax, sem montar a árvore do BeautifulSoup.
+    Links repetidos na mesma página são descartados antes de voltar ao crawler.
+
+    Args:
+        tree: Árvore LexborHTMLParser da página
+        base_url: URL da página, para resolver URLs relativas
+        exclude_rules: Padrões de exclusão, como em _should_exclude (opcional)
+
+    Returns:
+        list: Lista de URLs extraídas e normalizadas, sem repetições
+    """
+    links = []
+    seen_hrefs = set()
+    seen_links = set()
+
+    # Links relativos são resolvidos a partir de <base href>, se a página definir um
+    base = tree.css_first('base[href]')
+    if base is not None and base.attributes.get('href'):
+        base_url = urljoin(base_url, base.attributes['href'])
+
+    for anchor in tree.css('a[href]'):
+        href = anchor.attributes.get('href')
+        if not href or href in seen_hrefs:
+            continue
+        seen_hrefs.add(href)
+        normalized_url = _normalize_url(href, base_url)
+
+        if (normalized_url and
+                normalized_url not in seen_links and
+                not (exclude_rules and _should_exclude(normalized_url, exclude_rules))):
+            seen_links.add(normalized_url)
+            links.append(normalized_url)
+
+    return links
+
+
+def _parse_page(html, url, ignored_tags=None, extract_links=True, exclude_rules=None):
+    """
+    Extrai links e conteúdo de uma página, fazendo o parsing completo do HTML uma única vez.
+
+    Função de módulo (e não método) para que possa ser executada em um
+    ProcessPoolExecutor: o trabalho de CPU, incluindo a normalização e a
+    exclusão de cada link, sai do loop de eventos e roda em paralelo com as
+    buscas do Selenium.
+
+    Args:
+        html: Conteúdo HTML da página
+        url: URL da página
+        ignored_tags: Lista de tags para serem removidas (opcional)
+        extract_links: Se os links da página devem ser extraídos
+        exclude_rules: Padrões de exclusão de links, como em _should_exclude (opcional)
+
+    Returns:
+        tuple: (lista de links normalizados, conteúdo extraído)
+    """
+    tree = LexborHTMLParser(html)
+    links = _extract_links(tree, url, exclude_rules) if extract_links else []
+
+    # Depois dos links, a mesma árvore descarta as tags ignoradas (em C); o
+    # BeautifulSoup, necessário para o Markdown e os preços, só monta o que sobra
+    if ignored_tags is None:
+        ignored_tags = DEFAULT_IGNORED_TAGS
+    # strip_tags só aceita list: uma tupla levanta TypeError
+    tree.strip_tags(list(ignored_tags))
+    soup = BeautifulSoup(tree.html, 'lxml')
+    page_content = _extract_body_content(soup, url, ignored_tags=())
+
+    return links, page_content
+
+
+def _extract_pricing_info(soup):
+    """
+    Extrai e categoriza informações de preços da página.
+
+    Args:
+        soup: Objeto BeautifulSoup da página
+
+    Returns:
+        dict: Dicionário com informações de preços categorizados
+    """
+    pricing_info = {
+        'prices': {},
+        'currency': None
+    }
+
+    # Dicionário para armazenar preços categorizados
+    categorized_prices = {}
+
+    # Buscar elementos de preço
+    for element in soup.select(PRICE_SELECTOR):
+        text = element.get_text(strip=True).lower()
+
+        # Identificar categoria
+        category = 'Outros'
+        for cat, keywords in PRICE_CATEGORIES.items():
+            if any(keyword in text for keyword in keywords):
+                category = cat
+                break
+
+        # Buscar preços
+        for pattern in PRICE_PATTERNS:
+            matches = pattern.findall(text)
+
+            for match in matches:
+                # Normalizar valor do preço
+                full_price = match[0] if isinstance(match, tuple) else match
+
+                # Garantir formato correto
+                if not _RE_CURRENCY_PREFIX.match(full_price):
+                    full_price = f"R$ {full_price}" if ',' in full_price else full_price
+
+                # Preparar categoria no dicionário se não existir
+                if category not in categorized_prices:
+                    categorized_prices[category] = {
+                        'values': set(),
+                        'raw_texts': set()
+                    }
+
+                # Adicionar informações
+                categorized_prices[category]['values'].add(full_price)
+                categorized_prices[category]['raw_texts'].add(text)
+
+                # Detectar moeda
+                if 'R$' in full_price:
+                    pricing_info['currency'] = 'BRL'
+                elif '$' in full_price:
+                    pricing_info['currency'] = 'USD'
+                elif '€' in full_price:
+                    pricing_info['currency'] = 'EUR'
+
+    # Converter para formato final
+    for category, details in categorized_prices.items():
+        pricing_info['prices'][category] = {
+            'values': list(details['values']),
+            'raw_texts': list(details['raw_texts'])
+        }
+
+    return pricing_info
+
+
+def _find_price_description(price_element):
+    """
+    Encontra descrição para um elemento de preço.
+
+    Args:
+        price_element: Elemento BeautifulSoup contendo o preço
+
+    Returns:
+        str: Descrição do preço
+    """
+    # Lista de estratégias para encontrar descrição
+    description_strategies = [
+        # Buscar em elementos irmãos e pai
+        lambda: price_element.find_previous(['h1', 'h2', 'h3', 'p','span']),
+        lambda: price_element.find_previous('div'),
+        lambda: price_element.find_parent(['div', 'section']),
+    ]
+
+    # Tentar estratégias de busca de descrição
+    for strategy in description_strategies:
+        try:
+            context = strategy()
+            if context:
+                # Extrair texto do contexto
+                desc_text = context.get_text(strip=True)
+
+                # Filtrar descrições muito curtas ou irrelevantes
+                if desc_text and len(desc_text) > 3:
+                    # Limitar o tamanho da descrição
+                    return desc_text[:100]
+        except Exception:
+            continue
+
+    # Fallback se nenhuma descrição for encontrada
+    return "Preço"
+
+
+def _extract_body_content(soup, url, ignored_tags=None):
+    """
+    Extrai conteúdo relevante de uma página HTML em formato Markdown.
+
+    Args:
+        soup: Objeto BeautifulSoup da página (modificado durante a extração)
+        url: URL da página
+        ignored_tags: Lista de tags para serem removidas (opcional)
+
+    Returns:
+        dict: Conteúdo extraído em Markdown e metadados
+    """
+    # Fallback para as tags padrão
+    if ignored_tags is None:
+        ignored_tags = DEFAULT_IGNORED_TAGS
+
+    # Remover tags especificadas
+    if ignored_tags:
+        for element in soup(ignored_tags):
+            element.decompose()
+
+    # Extrair título
+    title = soup.title.string if soup.title else ""
+
+    # Converter HTML para Markdown
+    markdown_content = _convert_html_to_markdown(soup)
+
+    pricing_info = _extract_pricing_info(soup)
+
+    return {
+        'url': url,
+        'title': str(title) if title is not None else None,
+        'content': markdown_content,
+        'pricing': pricing_info,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def _markdown_list(element, ordered):
+    """
+    Prefixa os itens de uma lista com o marcador Markdown correspondente.
+
+    Apenas os itens diretos são prefixados: listas aninhadas já foram
+    convertidas antes, com a sua própria numeração, e entram em linhas
+    próprias abaixo do item, indentadas com tab (a limpeza final de espaços
+    preserva tabs).
+
+    Args:
+        element: Elemento <ul> ou <ol>
+        ordered: Se True, numera os itens
+    """
+    for i, li in enumerate(element.find_all('li', recursive=False), 1):
+        marker = f"{i}." if ordered else "-"
+        text = []
+        nested_lines = []
+
+        for child in li.children:
+            if child.name in ('ul', 'ol'):
+                for item in child.find_all('li', recursive=False):
+                    nested_lines.extend(f"\t{line}" for line in item.get_text().split('\n'))
+            elif child.name:
+                text.append(child.get_text())
+            elif not isinstance(child, Comment):
+                text.append(str(child))
+
+        li.string = '\n'.join([f"{marker} {''.join(text)}"] + nested_lines)
+
+
+# Conversores por tag: recebem o elemento (com os filhos já convertidos) e
+# retornam o texto que o substitui, ou None para mantê-lo como está
+HEADING_PREFIXES = {f'h{level}': '#' * level for level in range(1, 7)}
+
+MARKDOWN_CONVERTERS = {
+    **{tag: (lambda el, prefix=prefix: f"{prefix} {el.get_text()}")
+       for tag, prefix in HEADING_PREFIXES.items()},
+    'a': lambda el: f"[{el.get_text()}]({el['href']})" if el.has_attr('href') else None,
+    'strong': lambda el: f"**{el.get_text()}**",
+    'b': lambda el: f"**{el.get_text()}**",
+    'em': lambda el: f"*{el.get_text()}*",
+    'i': lambda el: f"*{el.get_text()}*",
+    'ul': lambda el: _markdown_list(el, ordered=False),
+    'ol': lambda el: _markdown_list(el, ordered=True),
+    'code': lambda el: f"`{el.get_text()}`",
+    'p': lambda el: el.get_text(),
+}
+
+
+def _convert_html_to_markdown(soup):
+    """
+    Converte conteúdo HTML para Markdown.
+
+    Args:
+        soup: Objeto BeautifulSoup
+
+    Returns:
+        str: Conteúdo em formato Markdown
+    """
+    # Uma única busca na árvore; percorrida em ordem inversa, cada elemento
+    # é convertido depois dos seus descendentes, então o texto de cada
+    # subárvore é montado uma só vez e a marcação interna é preservada
+    # (filtrar soup.descendants pelo nome é bem mais rápido que find_all com uma lista)
+    elements = [element for element in soup.descendants if element.name in MARKDOWN_CONVERTERS]
+    for element in reversed(elements):
+        text = MARKDOWN_CONVERTERS[element.name](element)
+        if text is not None:
+            element.string = text
+
+    # Limpar espaços em branco extras: split descarta as partes vazias entre
+    # separadores repetidos, sem passar o texto pelo motor de regex
+    markdown_text = soup.get_text(separator='\n').strip()
+    markdown_text = '\n'.join(filter(None, markdown_text.split('\n')))
+    markdown_text = ' '.join(filter(None, markdown_text.split(' ')))
+
+    return markdown_text
+
 
 class JSDomainCrawler:
     def __init__(self, domain_name, js_render_time=3, delay=1, max_pages=50,
-                 max_depth=2, respect_robots=False, concurrency=1, output_dir='crawled_data'):
+                 max_depth=2, respect_robots=False, concurrency=1, output_dir='crawled_data',
+                 store_html=False, static_fetch=True):
         """
         Inicializa o crawler para um domínio específico.
 
@@ -45,8 +608,10 @@ class JSDomainCrawler:
             max_pages: Número máximo de páginas para rastrear
             max_depth: Profundidade máxima do rastreamento
             respect_robots: Se deve respeitar as regras de robots.txt
-            concurrency: Número de navegadores Selenium para usar simultaneamente
+            concurrency: Número de abas do navegador (e páginas buscadas) em paralelo
             output_dir: Diretório para salvar os resultados
+            store_html: Se deve guardar o HTML bruto de cada página (em arquivos .html.gz)
+            static_fetch: Se deve tentar buscar cada página via requests antes do Selenium
         """
         # Configurações básicas
         self.domain_name = domain_name
@@ -57,18 +622,26 @@ class JSDomainCrawler:
         self.concurrency = concurrency
         self.js_render_time = js_render_time
         self.output_dir = output_dir
+        self.store_html = store_html
+        self.static_fetch = static_fetch
 
         # Verificar se o diretório de saída existe
         os.makedirs(output_dir, exist_ok=True)
+        if store_html:
+            os.makedirs(os.path.join(output_dir, 'html'), exist_ok=True)
 
-        # Configurações para exclusão de URLs
-        self.exclude_patterns = [
-            r'/cdn-cgi/',
-            r'/wp-admin/',
-            r'/wp-includes/',
-            r'/wp-content/uploads/',
-            r'\.(jpg|jpeg|gif|png|svg|css|js|ico|xml|pdf|zip|gz|rar)$'
-        ]
+        # Cada página é gravada como uma linha JSON assim que é extraída
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.pages_file = os.path.join(output_dir, f"crawl_{domain_name}_{timestamp}.jsonl")
+        self.state_file = os.path.join(output_dir, f"crawl_{domain_name}_{timestamp}.state.json")
+        # Checkpoint por domínio (sem timestamp), para que a próxima execução o encontre
+        self.checkpoint_file = os.path.join(output_dir, f"{domain_name}_checkpoint.pkl")
+
+        # Configurações para exclusão de URLs (comparadas sem diferenciar maiúsculas):
+        # trechos em qualquer parte da URL e extensões no final dela
+        self.exclude_fragments = ('/cdn-cgi/', '/wp-admin/', '/wp-includes/', '/wp-content/uploads/')
+        self.exclude_extensions = ('.jpg', '.jpeg', '.gif', '.png', '.svg', '.css', '.js',
+                                   '.ico', '.xml', '.pdf', '.zip', '.gz', '.rar')
 
         # Inicializar variáveis relacionadas ao domínio original e domínios relacionados
         self.include_com_domain = False
@@ -77,77 +650,139 @@ class JSDomainCrawler:
         self.allowed_domains = [domain_name]
 
         # Estruturas de dados para o rastreamento
-        self.url_queue = []  # (url, depth)
-        self.visited_urls = set()
-        self.page_contents = []
-        self.host_last_access = {}  # {host: timestamp}
-        self.robots_parsers = {}  # {host: parser}
-
-        # Inicializar com a URL base
-        self.url_queue.append((self.base_url, 0))
-
-        # Adicionar domínio .com relacionado se relevante
-        if self.include_com_domain:
-            com_url = f"https://{self.com_domain}{self.com_path_filter}"
-            self.url_queue.append((com_url, 0))
+        # Fila separada por host e heap com o próximo horário liberado de cada host
+        self.host_queues = defaultdict(deque)  # {host: deque((url, depth))}
+        self.host_ready_heap = []  # [(next_ok_ts, host)]
+        self.queued_count = 0
+        # Filtro de Bloom: memória limitada; um falso positivo raro apenas pula uma URL nova
+        self.visited_urls = ScalableBloomFilter(initial_capacity=max_pages * 4, error_rate=1e-6)
+        self.queued_urls = ScalableBloomFilter(initial_capacity=max_pages * 4, error_rate=1e-6)
+        self.stored_urls = set()  # URLs das páginas salvas (limitado por max_pages)
+        self.pages_processed = 0
+        self.host_last_access = _HOST_ACCESS  # {host: timestamp}, compartilhado
+        self.in_progress = {}  # {url: depth} das páginas buscadas e ainda não salvas
+        self.robots_ttl = 6 * 3600  # Validade (segundos) de um robots.txt em cache
+        self.robots_failure_ttl = 300  # Validade (segundos) de uma falha ao obter o robots.txt
+        self.robots_cache_size = 128  # Número máximo de hosts no cache
+        # Cache LRU persistido entre execuções no diretório de saída
+        self.robots_cache_file = os.path.join(output_dir, 'robots_cache.pkl')
+        self.robots_parsers = _ROBOTS_CACHE  # {host: (parser ou None, fetched_at)}, compartilhado
+        self._load_robots_cache()
+
+        # Memoizar a decisão por URL: o mesmo link aparece em várias páginas
+        self._is_allowed_url = functools.lru_cache(maxsize=16384)(self._is_allowed_url)
+
+        # Sessão HTTP com pool de conexões (keep-alive) para robots.txt e páginas estáticas
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = USER_AGENTS[0]
+        adapter = HTTPAdapter(pool_connections=max(concurrency, 1), pool_maxsize=max(concurrency, 1) * 4,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
+        # Retomar um crawling interrompido, continuando o mesmo arquivo de páginas,
+        # ou inicializar com a URL base
+        if self._load_checkpoint():
+            self._out = open(self.pages_file, 'ab')
+            # Descarta páginas gravadas depois do checkpoint: elas voltaram para a fila
+            self._out.truncate(self._resume_offset)
+        else:
+            self._out = open(self.pages_file, 'wb')
+            self._enqueue_url(self.base_url, 0)
+
+            # Adicionar domínio .com relacionado se relevante
+            if self.include_com_domain:
+                com_url = f"https://{self.com_domain}{self.com_path_filter}"
+                self._enqueue_url(com_url, 0)
 
         # Configurações de profundidade
         self.max_depth = max_depth
 
-        # Inicializar os drivers do Selenium
-        self.drivers = self._initialize_selenium_drivers()
+        # Inicializar o navegador Selenium com uma aba por worker
+        self._driver_lock = threading.Lock()
+        self._chrome_options = self._build_chrome_options()
+        self._waits = {}  # {id(driver): WebDriverWait}
+        self.driver, self.window_handles = self._initialize_selenium_drivers()
 
-    def _initialize_selenium_drivers(self):
+    def _build_chrome_options(self):
         """
-        Inicializa os drivers do Selenium para renderização de JavaScript.
+        Monta as opções do Chrome uma única vez, reaproveitadas quando o navegador é reiniciado.
 
         Returns:
-            list: Lista de instâncias do WebDriver
+            Options: Opções do Chrome
         """
-        drivers = []
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument('--disable-extensions')
+        # Sem imagens, áudio e serviços em segundo plano: nada disso entra no texto extraído
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--mute-audio')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-sync')
+        options.add_argument('--disable-translate')
+        options.add_argument('--disable-features=TranslateUI,MediaRouter')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        options.add_argument(f'user-agent={USER_AGENTS[0]}')
+        # driver.get retorna sem esperar o carregamento: cada aba carrega em paralelo
+        # enquanto o lock do driver fica livre, e a espera é feita em _fetch_with_selenium
+        options.page_load_strategy = 'none'
+        return options
+
+    def _initialize_selenium_drivers(self):
+        """
+        Inicializa um único navegador Selenium com uma aba para cada worker.
+
+        Abas compartilham o mesmo processo do Chrome, o que evita o custo de
+        memória e de inicialização de um navegador por worker.
 
+        Returns:
+            tuple: (instância do WebDriver, lista de handles das abas) ou (None, [])
+        """
         # Verificar se o ChromeDriver está disponível
-        chromedriver_path = '/usr/local/bin/chromedriver'
-        chromedriver_exists = os.path.exists(chromedriver_path)
-        logging.info(f"Verificando se ChromeDriver existe em {chromedriver_path}: {chromedriver_exists}")
+        chromedriver_exists = os.path.exists(CHROMEDRIVER_PATH)
+        logging.info(f"Verificando se ChromeDriver existe em {CHROMEDRIVER_PATH}: {chromedriver_exists}")
 
         if not chromedriver_exists:
             logging.warning("ChromeDriver não encontrado. Selenium não será utilizado.")
-            return []
-
-        # Criar instâncias do Selenium
-        for i in range(self.concurrency):
-            try:
-                logging.info(f"Iniciando navegador Selenium #{i + 1}")
-                options = Options()
-                options.add_argument('--headless=new')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--window-size=1920,1080')
-                options.add_argument('--disable-extensions')
-
-                # Usar um User-Agent aleatório
-                options.add_argument(f'user-agent={USER_AGENTS[i % len(USER_AGENTS)]}')
-
-                service = Service(chromedriver_path)
-                driver = webdriver.Chrome(service=service, options=options)
-
-                # Verificar se o navegador está realmente funcionando
-                driver.get("about:blank")
-                time.sleep(1)  # Esperar um momento para garantir que a página carregou
-
-                drivers.append(driver)
-                logging.info(f"Navegador Selenium #{i + 1} inicializado com sucesso")
-            except Exception as e:
-                logging.error(f"Erro ao inicializar navegador Selenium #{i + 1}: {str(e)}")
-                logging.error(traceback.format_exc())
+            return None, []
 
-        return drivers
+        try:
+            logging.info("Iniciando navegador Selenium")
+            service = Service(CHROMEDRIVER_PATH)
+            driver = webdriver.Chrome(service=service, options=self._chrome_options)
+
+            # Verificar se o navegador está realmente funcionando
+            driver.get("about:blank")
+            time.sleep(1)  # Esperar um momento para garantir que a página carregou
+
+            # Abrir uma aba por worker, cada uma com seu próprio User-Agent
+            window_handles = []
+            for i in range(self.concurrency):
+                if i > 0:
+                    driver.switch_to.new_window('tab')
+                self._configure_tab(driver, i)
+                window_handles.append(driver.current_window_handle)
+
+            logging.info(f"Navegador Selenium inicializado com sucesso ({len(window_handles)} abas)")
+            return driver, window_handles
+        except Exception as e:
+            logging.error(f"Erro ao inicializar navegador Selenium: {str(e)}")
+            logging.error(traceback.format_exc())
+            return None, []
 
     def _get_robots_parser(self, url):
         """
-        Obtém o parser robots.txt para um host específico.
+        Obtém o parser robots.txt em cache para o host de uma URL.
+
+        Não faz requisições: é chamado no loop de eventos, inclusive dentro da
+        condição da fila. O robots.txt é buscado antes, em _refresh_robots.
 
         Args:
             url: A URL do site
@@ -158,84 +793,142 @@ class JSDomainCrawler:
         if not self.respect_robots:
             return None
 
-        parsed_url = urlparse(url)
-        host = parsed_url.netloc
-
-        # Verificar se já temos um parser para este host
-        if host in self.robots_parsers:
-            return self.robots_parsers[host]
-
-        # Criar um novo parser
-        try:
-            from urllib import robotparser
-            parser = robotparser.RobotFileParser()
-            parser.set_url(f"https://{host}/robots.txt")
-            parser.read()
-            self.robots_parsers[host] = parser
-            return parser
-        except Exception as e:
-            logging.warning(f"Erro ao processar robots.txt para {host}: {e}")
+        host = _cached_urlparse(url).netloc
+        cached = self.robots_parsers.get(host)
+        if not cached:
             return None
 
-    def _normalize_url(self, url, base_url=None):
+        with _STATE_LOCK:
+            if host in self.robots_parsers:
+                self.robots_parsers.move_to_end(host)
+        return cached[0]
+
+    def _robots_expired(self, host):
         """
-        Normaliza URLs para evitar duplicações.
+        Verifica se o robots.txt de um host precisa ser buscado (ausente ou vencido).
 
         Args:
-            url (str): URL para normalizar
-            base_url (str, optional): URL base para resolução de URLs relativas
+            host: Host do site
 
         Returns:
-            str: URL normalizada
+            bool: True se não há entrada válida no cache
         """
-        # Resolve URL relativa se base_url for fornecida
-        if base_url:
-            from urllib.parse import urljoin
-            url = urljoin(base_url, url)
+        cached = self.robots_parsers.get(host)
+        if not cached:
+            return True
 
-        # Parseia a URL
-        parsed_url = urlparse(url)
+        parser, fetched_at = cached
+        ttl = self.robots_ttl if parser else self.robots_failure_ttl
+        return time.time() - fetched_at >= ttl
+
+    def _fetch_robots_parser(self, host):
+        """
+        Baixa e interpreta o robots.txt de um host, guardando o resultado no cache.
 
-        # Remove fragmentos
-        url_without_fragment = parsed_url._replace(fragment='')
+        Faz uma requisição bloqueante, então roda no pool de threads.
 
-        # Normaliza o caminho
-        normalized_path = self._normalize_path(url_without_fragment.path)
-        url_without_fragment = url_without_fragment._replace(path=normalized_path)
+        Args:
+            host: Host do site
 
-        # Converte para string
-        normalized_url = urlunparse(url_without_fragment)
+        Returns:
+            robotparser.RobotFileParser ou None
+        """
+        refreshing = host in self.robots_parsers
 
-        # Remove a barra final, se existir, exceto para URLs raiz
-        if normalized_url.endswith('/') and normalized_url != f"{parsed_url.scheme}://{parsed_url.netloc}/":
-            normalized_url = normalized_url.rstrip('/')
+        # Criar um novo parser, reaproveitando as conexões da sessão HTTP
+        try:
+            from urllib import robotparser
+            robots_url = f"https://{host}/robots.txt"
+            parser = robotparser.RobotFileParser()
+            parser.set_url(robots_url)
+
+            response = self.http.get(robots_url, timeout=5)
+            # Mesma semântica de RobotFileParser.read() para códigos de erro
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif 400 <= response.status_code < 500:
+                parser.allow_all = True
+            elif response.status_code < 400:
+                parser.parse(response.text.splitlines())
+        except Exception as e:
+            logging.warning(f"Erro ao processar robots.txt para {host}: {e}")
+            # A falha também fica em cache, por pouco tempo, para não repetir a busca a cada link
+            parser = None
 
-        # Remove o www. se presente
-        normalized_url = normalized_url.replace('://www.', '://')
+        with _STATE_LOCK:
+            self.robots_parsers[host] = (parser, time.time())
+            self.robots_parsers.move_to_end(host)
+            if len(self.robots_parsers) > self.robots_cache_size:
+                self.robots_parsers.popitem(last=False)
 
-        # Padroniza o protocolo (https)
-        if normalized_url.startswith('http://'):
-            normalized_url = normalized_url.replace('http://', 'https://')
+        # Decisões memoizadas com o robots.txt anterior deixam de valer
+        if refreshing:
+            self._is_allowed_url.cache_clear()
 
-        return normalized_url
+        return parser
 
-    def _normalize_path(self, path):
+    async def _refresh_robots(self, hosts):
         """
-        Normaliza o caminho da URL.
+        Busca no pool de threads o robots.txt ausente ou vencido dos hosts permitidos.
+
+        Chamado antes de filtrar ou agendar URLs desses hosts, para que nenhuma
+        requisição bloqueie o loop de eventos. Hosts já sendo buscados por outra
+        tarefa não são buscados de novo.
 
         Args:
-            path (str): Caminho da URL
+            hosts: Hosts cujas URLs serão filtradas ou agendadas
+        """
+        if not self.respect_robots:
+            return
 
-        Returns:
-            str: Caminho normalizado
+        loop = asyncio.get_running_loop()
+        fetches = []
+        for host in hosts:
+            if host not in self.allowed_domains or not self._robots_expired(host):
+                continue
+
+            future = self._robots_fetches.get(host)
+            if future is None:
+                future = loop.run_in_executor(self._fetch_pool, self._fetch_robots_parser, host)
+                self._robots_fetches[host] = future
+                future.add_done_callback(lambda _, host=host: self._robots_fetches.pop(host, None))
+            fetches.append(future)
+
+        if fetches:
+            await asyncio.gather(*fetches)
+
+    def _load_robots_cache(self):
+        """
+        Carrega o cache de robots.txt salvo por uma execução anterior no cache compartilhado.
+
+        Entradas já presentes no processo são mais recentes e têm prioridade.
         """
-        # Remove barras duplas
-        path = path.replace('//', '/')
+        try:
+            with open(self.robots_cache_file, 'rb') as f:
+                saved = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.warning(f"Erro ao carregar o cache de robots.txt: {e}")
+            return
 
-        # Remove barras no início e no final
-        path = path.strip('/')
+        with _STATE_LOCK:
+            for host, entry in saved.items():
+                self.robots_parsers.setdefault(host, entry)
+            while len(self.robots_parsers) > self.robots_cache_size:
+                self.robots_parsers.popitem(last=False)
 
-        return path
+    def _save_robots_cache(self):
+        """
+        Salva o cache de robots.txt para ser reaproveitado pela próxima execução.
+        """
+        if not self.robots_parsers:
+            return
+
+        tmp_file = f"{self.robots_cache_file}.tmp"
+        with _STATE_LOCK, open(tmp_file, 'wb') as f:
+            pickle.dump(self.robots_parsers, f)
+        os.replace(tmp_file, self.robots_cache_file)
 
     def _is_allowed_url(self, url):
         """
@@ -248,7 +941,7 @@ class JSDomainCrawler:
             bool: True se a URL for permitida
         """
         try:
-            parsed_url = urlparse(url)
+            parsed_url = _cached_urlparse(url)
             host = parsed_url.netloc
 
             # Verificar se o domínio é permitido
@@ -273,389 +966,416 @@ class JSDomainCrawler:
             logging.warning(f"Erro ao verificar permissão para URL {url}: {e}")
             return False
 
-    def _should_exclude(self, url):
+    def _filter_links(self, links):
         """
-        Verifica se uma URL deve ser excluída com base nos padrões de exclusão.
+        Filtra os links de uma página pelos domínios permitidos, robots.txt e URLs já enfileiradas.
+
+        É um gerador: quem consome pode parar cedo sem pagar as verificações
+        dos links restantes. O robots.txt dos hosts deve ter sido buscado
+        antes, com _refresh_robots.
 
         Args:
-            url: A URL para verificar
+            links: URLs normalizadas encontradas na página
 
         Returns:
-            bool: True se a URL deve ser excluída
+            generator: URLs que podem ser enfileiradas
         """
-        for pattern in self.exclude_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        return False
+        # Toda URL visitada passou antes pela fila, então basta checar queued_urls
+        return (link for link in links
+                if link not in self.queued_urls and self._is_allowed_url(link))
 
-    def _extract_links(self, html, base_url):
+    def _get_crawl_delay(self, url):
         """
-        Extrai links de uma página HTML.
+        Obtém o intervalo entre requisições para o host de uma URL.
 
         Args:
-            html: Conteúdo HTML da página
-            base_url: URL base para resolver URLs relativas
+            url: URL para a qual a requisição será feita
 
         Returns:
-            list: Lista de URLs extraídas e normalizadas
+            float: Intervalo (segundos) entre requisições ao mesmo host
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
-
-        for anchor in soup.find_all('a', href=True):
-            href = anchor['href']
-            normalized_url = self._normalize_url(href, base_url)
-
-            if (normalized_url and
-                    normalized_url not in self.visited_urls and
-                    self._is_allowed_url(normalized_url) and
-                    not self._should_exclude(normalized_url)):
-                links.append(normalized_url)
+        # Verificar o delay de robots.txt se necessário
+        robot_delay = None
+        if self.respect_robots:
+            parser = self._get_robots_parser(url)
+            if parser:
+                robot_delay = parser.crawl_delay("*")
 
-        return links
+        # Usar o maior valor entre o delay configurado e o de robots.txt
+        return max(self.delay, robot_delay or 0)
 
-    def _extract_pricing_info(self, soup):
+    def _enqueue_url(self, url, depth):
         """
-        Extrai e categoriza informações de preços da página.
+        Adiciona uma URL à fila do seu host, agendando o host se necessário.
+
+        URLs que já passaram pela fila são ignoradas, de modo que links repetidos
+        em várias páginas (menus, rodapés) não incham as filas.
 
         Args:
-            soup: Objeto BeautifulSoup da página
+            url: URL para adicionar
+            depth: Profundidade da URL no rastreamento
 
         Returns:
-            dict: Dicionário com informações de preços categorizados
+            bool: True se a URL foi adicionada
         """
-        pricing_info = {
-            'prices': {},
-            'currency': None
-        }
+        # add() retorna True se a URL já estava no filtro
+        if self.queued_urls.add(url):
+            return False
 
-        # Padrões de regex para capturar preços
-        price_patterns = [
-            r'((?:R\$|€|\$)\s*\d{1,3}(?:\.\d{3})*(?:,\d{2})?)',
-            r'((?:R\$|€|\$)\s*\d+(?:,\d{2})?)',
-            r'(\d+(?:,\d{2})?\s*(?:R\$|€|\$))'
-        ]
-
-        # Categorias de preço com palavras-chave
-        price_categories = {
-            'À Vista': ['à vista', 'avista', 'vista', 'cash', 'dinheiro', 'boleto'],
-            'Parcelado': ['parcelado', 'parcela', 'x de', 'parcelas', 'installment'],
-            'Promocional': ['promo', 'desconto', 'oferta', 'sale', 'discount'],
-            'Original': ['original', 'preço original', 'preço cheio'],
-            'Assinatura': ['mensalidade', 'assinatura', 'subscription', 'monthly'],
-            'Atacado': ['atacado', 'wholesale', 'quantidade'],
-            'Internacional': ['internacional', 'dollar', 'euro']
-        }
+        host = _cached_urlparse(url).netloc
+        queue = self.host_queues[host]
+        if not queue:
+            # Host sem URLs pendentes: fica liberado após o intervalo desde o último acesso
+            last_access = self.host_last_access.get(host)
+            ready_at = last_access + self._get_crawl_delay(url) if last_access else 0
+            heapq.heappush(self.host_ready_heap, (ready_at, host))
+
+        queue.append((url, depth))
+        self.queued_count += 1
+        return True
+
+    def _next_url(self):
+        """
+        Retira a próxima URL de um host cujo intervalo entre requisições já passou.
 
-        # Seletores para buscar elementos com preços
-        price_selectors = [
-            'span.price', 'div.price', 'p.price',
-            '.product-price', '.item-price', '.sale-price',
-            '[data-price]', '[class*="price"]', '[id*="price"]'
-        ]
+        Em vez de dormir esperando um host, o worker atende qualquer outro host
+        que já esteja liberado.
 
-        # Dicionário para armazenar preços categorizados
-        categorized_prices = {}
+        Returns:
+            tuple: ((url, depth), None) se houver host liberado, ou
+                (None, segundos até o próximo host liberado) caso contrário
+        """
+        now = time.time()
+        while self.host_ready_heap:
+            ready_at, host = self.host_ready_heap[0]
+            queue = self.host_queues[host]
+
+            # Descartar URLs já visitadas sem consumir o intervalo do host
+            while queue and queue[0][0] in self.visited_urls:
+                queue.popleft()
+                self.queued_count -= 1
+
+            if not queue:
+                heapq.heappop(self.host_ready_heap)
+                del self.host_queues[host]
+                continue
 
-        # Buscar elementos de preço
-        for selector in price_selectors:
-            price_elements = soup.select(selector)
+            if ready_at > now:
+                return None, ready_at - now
 
-            for element in price_elements:
-                text = element.get_text(strip=True).lower()
+            heapq.heappop(self.host_ready_heap)
+            url, depth = queue.popleft()
+            self.queued_count -= 1
 
-                # Identificar categoria
-                category = 'Outros'
-                for cat, keywords in price_categories.items():
-                    if any(keyword in text for keyword in keywords):
-                        category = cat
-                        break
+            # Registrar o acesso e reagendar o host se ainda houver URLs pendentes
+            self.host_last_access[host] = now
+            if queue:
+                heapq.heappush(self.host_ready_heap, (now + self._get_crawl_delay(url), host))
+            else:
+                del self.host_queues[host]
 
-                # Buscar preços
-                for pattern in price_patterns:
-                    matches = re.findall(pattern, text)
+            return (url, depth), None
 
-                    for match in matches:
-                        # Normalizar valor do preço
-                        full_price = match[0] if isinstance(match, tuple) else match
+        return None, None
 
-                        # Garantir formato correto
-                        if not re.match(r'^(?:R\$|€|\$)', full_price):
-                            full_price = f"R$ {full_price}" if ',' in full_price else full_price
+    def _reserve_next_slot(self, url):
+        """
+        Reserva o próximo horário liberado do host para uma nova requisição à mesma URL.
 
-                        # Preparar categoria no dicionário se não existir
-                        if category not in categorized_prices:
-                            categorized_prices[category] = {
-                                'values': set(),
-                                'raw_texts': set()
-                            }
+        Usado quando a página obtida via requests precisa ser buscada de novo pelo
+        Selenium: a segunda requisição também respeita o intervalo do host, e o
+        host é adiado na fila para as URLs seguintes.
 
-                        # Adicionar informações
-                        categorized_prices[category]['values'].add(full_price)
-                        categorized_prices[category]['raw_texts'].add(text)
+        Args:
+            url: URL que será buscada novamente
 
-                        # Detectar moeda
-                        if 'R$' in full_price:
-                            pricing_info['currency'] = 'BRL'
-                        elif '$' in full_price:
-                            pricing_info['currency'] = 'USD'
-                        elif '€' in full_price:
-                            pricing_info['currency'] = 'EUR'
+        Returns:
+            float: Segundos a aguardar antes da nova requisição
+        """
+        host = _cached_urlparse(url).netloc
+        delay = self._get_crawl_delay(url)
+        now = time.time()
+        slot = max(now, self.host_last_access.get(host, 0) + delay)
+        self.host_last_access[host] = slot
+
+        # Cada host com URLs pendentes tem uma única entrada no heap
+        for i, (ready_at, queued_host) in enumerate(self.host_ready_heap):
+            if queued_host == host:
+                if ready_at < slot + delay:
+                    self.host_ready_heap[i] = (slot + delay, host)
+                    heapq.heapify(self.host_ready_heap)
+                break
+
+        return slot - now
+
+    def _configure_tab(self, driver, tab_index):
+        """
+        Configura a aba atual via CDP: User-Agent próprio, bloqueio de mídia, CSS e fontes
+        e o script auxiliar de rolagem.
 
-        # Converter para formato final
-        for category, details in categorized_prices.items():
-            pricing_info['prices'][category] = {
-                'values': list(details['values']),
-                'raw_texts': list(details['raw_texts'])
-            }
+        Comandos CDP valem apenas para a aba em que são enviados.
 
-        return pricing_info
+        Args:
+            driver: Instância do WebDriver, com a aba a configurar selecionada
+            tab_index: Índice da aba
+        """
+        driver.execute_cdp_cmd('Network.setUserAgentOverride',
+                               {'userAgent': USER_AGENTS[tab_index % len(USER_AGENTS)]})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SCROLL_HELPER_SCRIPT})
 
-    def _find_price_description(self, price_element):
+    def _get_available_tab(self, tab_index):
         """
-        Encontra descrição para um elemento de preço.
+        Obtém a aba do navegador reservada para um worker.
+
+        Não consulta o navegador: uma aba fechada ou um navegador travado só são
+        detectados quando um comando falha, e então recuperados por _revive_tab.
 
         Args:
-            price_element: Elemento BeautifulSoup contendo o preço
+            tab_index: Índice da aba atribuída ao worker
 
         Returns:
-            str: Descrição do preço
-        """
-        # Lista de estratégias para encontrar descrição
-        description_strategies = [
-            # Buscar em elementos irmãos e pai
-            lambda: price_element.find_previous(['h1', 'h2', 'h3', 'p','span']),
-            lambda: price_element.find_previous('div'),
-            lambda: price_element.find_parent(['div', 'section']),
-        ]
-
-        # Tentar estratégias de busca de descrição
-        for strategy in description_strategies:
-            try:
-                context = strategy()
-                if context:
-                    # Extrair texto do contexto
-                    desc_text = context.get_text(strip=True)
-
-                    # Filtrar descrições muito curtas ou irrelevantes
-                    if desc_text and len(desc_text) > 3:
-                        # Limitar o tamanho da descrição
-                        return desc_text[:100]
-            except Exception:
-                continue
+            tuple: (instância do driver, handle da aba) ou (None, None)
+        """
+        with self._driver_lock:
+            # Verificar se temos um navegador disponível
+            if not self.driver or tab_index >= len(self.window_handles):
+                logging.warning("Sem navegador Selenium disponível")
+                return None, None
 
-        # Fallback se nenhuma descrição for encontrada
-        return "Preço"
+            return self.driver, self.window_handles[tab_index]
 
-    def _extract_body_content(self, html, url, ignored_tags=None):
+    def _revive_tab(self, tab_index, failed_driver):
         """
-        Extrai conteúdo relevante de uma página HTML em formato Markdown.
+        Recupera a aba de um worker após uma falha, recriando a aba ou o navegador.
 
         Args:
-            html: Conteúdo HTML da página
-            url: URL da página
-            ignored_tags: Lista de tags para serem removidas (opcional)
+            tab_index: Índice da aba atribuída ao worker
+            failed_driver: Driver em que o comando falhou
 
         Returns:
-            dict: Conteúdo extraído em Markdown e metadados
+            tuple: (instância do driver, handle da aba) ou (None, None)
         """
-        # Obtém as tags a serem ignoradas dos kwargs (com fallback para tags padrão)
-        ignored_tags = getattr(self, '_extract_body_content_kwargs', {}).get(
-            'ignored_tags',
-            ['script', 'style', 'meta', 'link', 'img', 'svg', 'header', 'footer', 'nav']
-        )
+        with self._driver_lock:
+            # Outro worker já reiniciou o navegador
+            if self.driver is not failed_driver:
+                if not self.driver or tab_index >= len(self.window_handles):
+                    return None, None
+                return self.driver, self.window_handles[tab_index]
 
-        soup = BeautifulSoup(html, 'html.parser')
+            try:
+                if self.window_handles[tab_index] not in self.driver.window_handles:
+                    # A aba foi fechada, mas o navegador ainda responde
+                    self.driver.switch_to.new_window('tab')
+                    self._configure_tab(self.driver, tab_index)
+                    self.window_handles[tab_index] = self.driver.current_window_handle
+                    logging.info(f"Aba #{tab_index} recriada com sucesso")
+                return self.driver, self.window_handles[tab_index]
+            except Exception as e:
+                logging.warning(f"Navegador Selenium não está mais válido: {e}")
 
-        # Remover tags especificadas
-        for element in soup(ignored_tags):
-            element.decompose()
+            # Tentar reiniciar o navegador
+            try:
+                self.driver.quit()
+            except:
+                pass
 
-        # Extrair título
-        title = soup.title.string if soup.title else ""
+            self.driver, self.window_handles = self._initialize_selenium_drivers()
+            if not self.driver or tab_index >= len(self.window_handles):
+                logging.error("Falha ao reiniciar o navegador Selenium")
+                return None, None
 
-        # Converter HTML para Markdown
-        markdown_content = self._convert_html_to_markdown(soup)
+            return self.driver, self.window_handles[tab_index]
 
-        pricing_info = self._extract_pricing_info(soup)
+    def _get_page_wait(self, driver):
+        """
+        Obtém o WebDriverWait do navegador atual, criado uma única vez por navegador.
 
-        return {
-            'url': url,
-            'title': title,
-            'content': markdown_content,
-            'pricing': pricing_info,
-            'timestamp': datetime.now().isoformat()
-        }
+        Args:
+            driver: Instância do WebDriver
 
-    def _convert_html_to_markdown(self, soup):
+        Returns:
+            WebDriverWait: Espera limitada a js_render_time segundos
         """
-        Converte conteúdo HTML para Markdown.
+        wait = self._waits.get(id(driver))
+        if wait is None:
+            wait = WebDriverWait(driver, self.js_render_time, poll_frequency=0.2,
+                                 ignored_exceptions=[JavascriptException])
+            # Descarta esperas de navegadores anteriores
+            self._waits = {id(driver): wait}
+        return wait
+
+    def _execute_in_tab(self, driver, handle, script, *args):
+        """
+        Executa um script em uma aba específica do navegador compartilhado.
 
         Args:
-            soup: Objeto BeautifulSoup
+            driver: Instância do WebDriver
+            handle: Handle da aba
+            script: Código JavaScript para executar
 
         Returns:
-            str: Conteúdo em formato Markdown
+            Valor retornado pelo script
         """
-        # Processamento de cabeçalhos
-        for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            level = int(h.name[1])
-            h.string = f"{'#' * level} {h.get_text()}"
-
-        # Processamento de links
-        for a in soup.find_all('a'):
-            if a.has_attr('href'):
-                a.string = f"[{a.get_text()}]({a['href']})"
+        with self._driver_lock:
+            driver.switch_to.window(handle)
+            return driver.execute_script(script, *args)
 
-        # Processamento de ênfase
-        for strong in soup.find_all(['strong', 'b']):
-            strong.string = f"**{strong.get_text()}**"
+    def _fetch_with_requests(self, url):
+        """
+        Busca uma página diretamente via HTTP, sem passar pelo navegador.
 
-        for em in soup.find_all(['em', 'i']):
-            em.string = f"*{em.get_text()}*"
+        O HTML só é aceito se a página parecer renderizada no servidor: resposta
+        HTML com texto suficiente no <body> e pouco JavaScript. Páginas que
+        dependem de scripts para montar o conteúdo ficam para o Selenium.
 
-        # Processamento de listas
-        for ul in soup.find_all('ul'):
-            for li in ul.find_all('li'):
-                li.string = f"- {li.get_text()}"
+        Args:
+            url: URL para buscar
 
-        for ol in soup.find_all('ol'):
-            for i, li in enumerate(ol.find_all('li'), 1):
-                li.string = f"{i}. {li.get_text()}"
+        Returns:
+            str: Conteúdo HTML da página ou None se ela precisar ser renderizada
+        """
+        try:
+            # Com stream=True só os cabeçalhos são lidos antes da verificação do tipo:
+            # arquivos que não são HTML nunca são baixados
+            with self.http.get(url, timeout=10, stream=True) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status_code != 200 or 'text/html' not in content_type:
+                    return None
+
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    content += chunk
+                    if len(content) > STATIC_MAX_BYTES:
+                        return None
+        except requests.RequestException as e:
+            logging.info(f"Falha ao buscar {url} com requests, usando Selenium: {e}")
+            return None
 
-        # Processamento de código
-        for code in soup.find_all('code'):
-            code.string = f"`{code.get_text()}`"
+        header_charset = 'charset' in content_type.lower() and response.encoding
+        html_content = _decode_html(bytes(content), header_charset or None)
 
-        # Processamento de parágrafos
-        for p in soup.find_all('p'):
-            p.string = p.get_text()
+        tree = LexborHTMLParser(html_content)
+        script_length = sum(len(script.text()) for script in tree.css('script'))
+        tree.strip_tags(['script', 'style', 'noscript'])
+        text_length = len(tree.body.text(strip=True)) if tree.body else 0
 
-        # Limpar espaços em branco extras
-        markdown_text = soup.get_text(separator='\n').strip()
-        markdown_text = re.sub(r'\n+', '\n', markdown_text)
-        markdown_text = re.sub(r' +', ' ', markdown_text)
+        if text_length < STATIC_MIN_TEXT_LENGTH or script_length > text_length * STATIC_MAX_SCRIPT_RATIO:
+            return None
 
-        return markdown_text
+        logging.info(f"Página estática obtida com requests: {url}")
+        return html_content
 
-    def _respect_crawl_delay(self, url):
+    def _navigate(self, driver, handle, url):
         """
-        Respeita o intervalo entre requisições para o mesmo host.
+        Inicia a navegação de uma aba, sem esperar o carregamento.
 
         Args:
-            url: URL para a qual a requisição será feita
+            driver: Instância do WebDriver
+            handle: Handle da aba
+            url: URL para acessar
         """
-        parsed_url = urlparse(url)
-        host = parsed_url.netloc
+        with self._driver_lock:
+            driver.switch_to.window(handle)
+            driver.execute_script(MARK_STALE_SCRIPT)
+            driver.get(url)
 
-        # Verificar o delay de robots.txt se necessário
-        robot_delay = None
-        if self.respect_robots:
-            parser = self._get_robots_parser(url)
-            if parser:
-                robot_delay = parser.crawl_delay("*")
+    def _wait_for_stable_dom(self, driver, handle, timeout=1, interval=0.2):
+        """
+        Aguarda o número de elementos da página parar de crescer.
 
-        # Usar o maior valor entre o delay configurado e o de robots.txt
-        delay = max(self.delay, robot_delay or 0)
+        Retorna assim que o DOM fica igual por duas leituras seguidas, ou após
+        timeout segundos, em vez de esperar sempre o tempo máximo.
 
-        # Verificar quando foi a última requisição para este host
-        last_access = self.host_last_access.get(host)
-        if last_access:
-            elapsed = time.time() - last_access
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                time.sleep(sleep_time)
+        Args:
+            driver: Instância do WebDriver
+            handle: Handle da aba
+            timeout: Tempo máximo (segundos) de espera
+            interval: Intervalo (segundos) entre as leituras
+        """
+        deadline = time.monotonic() + timeout
+        last_count = self._execute_in_tab(driver, handle, DOM_SIZE_SCRIPT)
+        unchanged = 0
 
-        # Atualizar o timestamp de acesso
-        self.host_last_access[host] = time.time()
+        while unchanged < 2 and time.monotonic() < deadline:
+            time.sleep(interval)
+            count = self._execute_in_tab(driver, handle, DOM_SIZE_SCRIPT)
+            unchanged = unchanged + 1 if count == last_count else 0
+            last_count = count
 
-    def _get_available_driver(self):
+    def _scroll_page(self, driver, handle):
         """
-        Obtém um driver Selenium disponível, mantendo consistência.
+        Rola a página de tela em tela para carregar conteúdo lazy-loaded.
 
-        Returns:
-            tuple: (índice do driver, instância do driver) ou (None, None)
-        """
-        # Verificar se temos drivers disponíveis
-        if not self.drivers:
-            logging.warning("Sem drivers Selenium disponíveis")
-            return None, None
-
-        # Redefinir a variável de classe se necessário para evitar referência vazia
-        if len(self.drivers) == 0:
-            logging.warning("Array de drivers vazio, reinicializando")
-            self.drivers = self._initialize_selenium_drivers()
-            if len(self.drivers) == 0:
-                return None, None
+        Ao chegar ao fim, aguarda o DOM estabilizar e continua se a página
+        cresceu. Para assim que a janela não consegue mais rolar (fim da página,
+        página que cabe em uma tela, overlay com overflow:hidden ou rolagem em
+        um contêiner interno) ou após js_render_time segundos.
 
-        # Verificar cada driver para garantir que está em um estado utilizável
-        valid_drivers = []
-        for i, driver in enumerate(self.drivers):
-            try:
-                # Tentar acessar uma propriedade para verificar se o driver está funcional
-                _ = driver.current_url
-                valid_drivers.append((i, driver))
-            except Exception as e:
-                logging.warning(f"Driver #{i} não está mais válido: {e}")
-                # Tentar reiniciar o driver
-                try:
-                    driver.quit()
-                except:
-                    pass
-
-                try:
-                    options = Options()
-                    options.add_argument('--headless=new')
-                    options.add_argument('--no-sandbox')
-                    options.add_argument('--disable-dev-shm-usage')
-                    options.add_argument('--disable-gpu')
-                    options.add_argument('--window-size=1920,1080')
-                    options.add_argument('--disable-extensions')
-
-                    service = Service('/usr/local/bin/chromedriver')
-                    self.drivers[i] = webdriver.Chrome(service=service, options=options)
-                    valid_drivers.append((i, self.drivers[i]))
-                    logging.info(f"Driver #{i} reinicializado com sucesso")
-                except Exception as e:
-                    logging.error(f"Falha ao reiniciar driver #{i}: {e}")
-
-        if not valid_drivers:
-            logging.error("Nenhum driver válido disponível")
-            return None, None
-
-        # Usar o primeiro driver válido disponível
-        return valid_drivers[0]
-
-    def _fetch_with_selenium(self, url):
+        Args:
+            driver: Instância do WebDriver
+            handle: Handle da aba
+        """
+        deadline = time.monotonic() + self.js_render_time
+
+        while time.monotonic() < deadline:
+            scrolled, at_bottom = self._execute_in_tab(driver, handle, "return window.__scroll();")
+            if not scrolled:
+                break
+
+            if at_bottom:
+                self._wait_for_stable_dom(driver, handle)
+
+    def _fetch_with_selenium(self, url, tab_index):
         """
         Busca uma página usando Selenium para renderizar JavaScript.
 
+        Executado em uma thread do pool de fetch, pois as chamadas do WebDriver
+        são bloqueantes. Como as abas compartilham o mesmo driver, a troca de aba
+        e o comando seguinte são feitos sob lock; o carregamento e as esperas
+        ficam fora dele, então as abas carregam páginas em paralelo.
+
         Args:
             url: URL para buscar
+            tab_index: Índice da aba atribuída ao worker
 
         Returns:
             str: Conteúdo HTML da página renderizada ou None em caso de erro
         """
-        driver_index, driver = self._get_available_driver()
+        driver, handle = self._get_available_tab(tab_index)
         if not driver:
             logging.warning(f"Sem navegador disponível para renderizar {url}")
             return None
 
         try:
-            logging.info(f"Acessando {url} com Selenium (driver #{driver_index})")
-            driver.get(url)
-
-            # Aguardar o carregamento do JavaScript
-            time.sleep(self.js_render_time)
+            logging.info(f"Acessando {url} com Selenium (aba #{tab_index})")
+            try:
+                self._navigate(driver, handle, url)
+            except WebDriverException as e:
+                # Aba fechada ou navegador travado: recuperar e tentar uma vez mais
+                logging.warning(f"Falha na aba #{tab_index} ao acessar {url}: {e}")
+                driver, handle = self._revive_tab(tab_index, driver)
+                if not driver:
+                    return None
+                self._navigate(driver, handle, url)
+
+            # Aguardar o carregamento do JavaScript, no máximo js_render_time segundos
+            try:
+                self._get_page_wait(driver).until(
+                    lambda d: self._execute_in_tab(d, handle, PAGE_READY_SCRIPT))
+            except TimeoutException:
+                logging.info(f"Tempo de renderização esgotado para {url}; usando o conteúdo atual")
 
             # Rolar a página para carregar conteúdo lazy-loaded
             try:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)  # Esperar um pouco após a rolagem
+                self._scroll_page(driver, handle)
             except:
                 pass
 
-            html_content = driver.page_source
+            html_content = self._execute_in_tab(driver, handle, PAGE_SOURCE_SCRIPT)
+            if html_content is None:
+                logging.warning(f"A navegação para {url} não foi concluída")
             return html_content
 
         except WebDriverException as e:
@@ -666,112 +1386,355 @@ class JSDomainCrawler:
             logging.error(f"Erro ao acessar {url} com Selenium: {str(e)}")
             return None
 
-    def crawl(self):
+    async def crawl(self):
         """
         Inicia o processo de rastreamento do domínio.
 
+        Cada aba do navegador é atribuída a um worker assíncrono; os workers
+        consomem a mesma fila de URLs e as chamadas bloqueantes do WebDriver
+        rodam em um pool de threads, de modo que as páginas são buscadas em paralelo.
+
         Returns:
-            list: Conteúdo extraído de todas as páginas rastreadas
+            str: Caminho do relatório final
         """
         logging.info(f"Iniciando crawler no(s) domínio(s): {', '.join(self.allowed_domains)}")
 
-        pages_processed = 0
+        # Garantir que temos um navegador disponível
+        if not getattr(self, 'driver', None):
+            logging.warning("Inicializando navegador Selenium novamente")
+            self.driver, self.window_handles = self._initialize_selenium_drivers()
+
+        # Sem o navegador, as páginas estáticas ainda são buscadas em paralelo via requests
+        num_workers = max(len(self.window_handles), self.concurrency if self.static_fetch else 1, 1)
+        self._active_workers = 0  # Páginas em andamento: sendo buscadas ou processadas
+        self._page_tasks = set()
+        self._frontier = asyncio.Condition()
+        # Tags ignoradas resolvidas uma vez, e não a cada página
+        ignored_tags = getattr(self, '_extract_body_content_kwargs', {}).get('ignored_tags')
+        self._ignored_tags = list(ignored_tags) if ignored_tags is not None else None
+        self._fetch_pool = ThreadPoolExecutor(max_workers=num_workers)
+        self._robots_fetches = {}  # {host: future} das buscas de robots.txt em andamento
+        # Processos criados via spawn: o fork de um processo com threads ativas não é seguro.
+        # Cada aba entrega uma página por vez, então bastam num_workers processos
+        self._parse_pool = ProcessPoolExecutor(max_workers=min(num_workers, os.cpu_count() or 1),
+                                               mp_context=multiprocessing.get_context('spawn'))
+
+        completed = False
+        try:
+            # robots.txt dos hosts já na fila, antes de os workers agendarem as URLs
+            await self._refresh_robots(list(self.host_queues))
+            await asyncio.gather(*[self._worker(i) for i in range(num_workers)])
+            completed = True
 
-        # Garantir que temos drivers disponíveis
-        if not hasattr(self, 'drivers') or not self.drivers:
-            logging.warning("Inicializando drivers do Selenium novamente")
-            self.drivers = self._initialize_selenium_drivers()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            logging.info("Crawler interrompido pelo usuário")
 
-        try:
-            while self.url_queue and pages_processed < self.max_pages:
-                url, depth = self.url_queue.pop(0)
+        except Exception as e:
+            logging.error(f"Erro durante o crawling: {str(e)}")
+            logging.error(traceback.format_exc())
 
-                # Verificar se já visitamos esta URL
-                if url in self.visited_urls:
-                    continue
+        finally:
+            # Salvar resultados
+            self._out.close()
+            output_file = self.save_to_json()
 
-                # Marcar como visitada
-                self.visited_urls.add(url)
+            # Um crawling concluído não deve ser retomado; um interrompido guarda onde parou
+            if completed:
+                if os.path.exists(self.checkpoint_file):
+                    os.remove(self.checkpoint_file)
+            else:
+                self._save_checkpoint()
 
-                # Respeitar delays entre requisições
-                self._respect_crawl_delay(url)
+            self._save_robots_cache()
 
-                logging.info(
-                    f"Processando {url} (profundidade: {depth}, páginas: {pages_processed + 1}/{self.max_pages})")
+            # Limpar recursos
+            self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._cleanup_drivers()
 
-                # Obter conteúdo da página com Selenium
-                html_content = self._fetch_with_selenium(url)
+        return output_file
 
-                if not html_content:
-                    logging.warning(f"Não foi possível obter conteúdo de {url}")
-                    continue
+    def _can_dispatch(self):
+        """
+        Verifica se há URLs na fila e orçamento de páginas para despachá-las.
 
-                # Extrair conteúdo
-                page_content = self._extract_body_content(html_content, url)
-                self.page_contents.append(page_content)
+        Returns:
+            bool: True se um worker pode retirar a próxima URL da fila
+        """
+        return self.queued_count > 0 and self.pages_processed + self._active_workers < self.max_pages
 
-                pages_processed += 1
+    async def _worker(self, tab_index):
+        """
+        Consome URLs da fila até que ela se esgote ou o limite de páginas seja atingido.
 
-                # Salvar resultados intermediários a cada 10 páginas
-                if pages_processed % 10 == 0:
-                    self._save_intermediate_results()
+        Args:
+            tab_index: Índice da aba do navegador usada por este worker
+        """
+        while True:
+            async with self._frontier:
+                while True:
+                    if not self._can_dispatch():
+                        if not self._active_workers:
+                            self._frontier.notify_all()
+                            return
+
+                        # Aguardar enquanto outros workers ainda podem adicionar links à fila
+                        await self._frontier.wait()
+                        continue
+
+                    entry, wait_time = self._next_url()
+                    if entry:
+                        break
 
-                # Se ainda não atingimos a profundidade máxima, extrair links
-                if depth < self.max_depth:
-                    links = self._extract_links(html_content, url)
+                    # Nenhum host liberado: aguardar o mais próximo ou a chegada de novos links
+                    if wait_time is not None:
+                        try:
+                            await asyncio.wait_for(self._frontier.wait(), wait_time)
+                        except asyncio.TimeoutError:
+                            pass
 
-                    # Adicionar links à fila
-                    for link in links:
-                        if link not in self.visited_urls:
-                            self.url_queue.append((link, depth + 1))
+                url, depth = entry
+                self._active_workers += 1
 
-        except KeyboardInterrupt:
-            logging.info("Crawler interrompido pelo usuário")
+            try:
+                await self._process_url(url, depth, tab_index)
+            except Exception as e:
+                logging.error(f"Erro ao processar {url}: {str(e)}")
+                logging.error(traceback.format_exc())
+            finally:
+                async with self._frontier:
+                    self._active_workers -= 1
+                    self._frontier.notify_all()
 
+    async def _process_url(self, url, depth, tab_index):
+        """
+        Busca uma URL e agenda a extração do seu conteúdo e dos seus links.
+
+        Args:
+            url: URL para processar
+            depth: Profundidade da URL no rastreamento
+            tab_index: Índice da aba do navegador usada para a busca
+        """
+        # Verificar se já visitamos esta URL
+        if url in self.visited_urls:
+            return
+
+        # Marcar como visitada
+        self.visited_urls.add(url)
+        self.in_progress[url] = depth
+
+        logging.info(
+            f"Processando {url} (profundidade: {depth}, páginas: {self.pages_processed + 1}/{self.max_pages})")
+
+        # Obter conteúdo da página sem bloquear o loop de eventos: via requests se
+        # a página for estática, senão renderizada pelo Selenium
+        loop = asyncio.get_running_loop()
+        html_content = None
+        if self.static_fetch:
+            html_content = await loop.run_in_executor(self._fetch_pool, self._fetch_with_requests, url)
+            if not html_content:
+                # O Selenium fará uma segunda requisição ao host: aguardar o intervalo
+                async with self._frontier:
+                    wait_time = self._reserve_next_slot(url)
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+        if not html_content:
+            html_content = await loop.run_in_executor(
+                self._fetch_pool, self._fetch_with_selenium, url, tab_index)
+
+        if not html_content or url in self.stored_urls:
+            if not html_content:
+                logging.warning(f"Não foi possível obter conteúdo de {url}")
+            self.in_progress.pop(url, None)
+            return
+
+        # A página é processada em segundo plano: a aba fica livre para buscar a
+        # próxima URL enquanto este HTML é convertido. A página continua contando
+        # como em andamento até ser gravada
+        async with self._frontier:
+            self._active_workers += 1
+        task = asyncio.create_task(self._store_page(url, depth, html_content))
+        self._page_tasks.add(task)
+        task.add_done_callback(self._page_tasks.discard)
+
+    async def _store_page(self, url, depth, html_content):
+        """
+        Extrai o conteúdo e os links de uma página já buscada, grava o resultado e enfileira os links.
+
+        Args:
+            url: URL da página
+            depth: Profundidade da URL no rastreamento
+            html_content: Conteúdo HTML da página
+        """
+        try:
+            # Parsing e conversão para Markdown em outro processo, em paralelo com as buscas
+            loop = asyncio.get_running_loop()
+            links, page_content = await loop.run_in_executor(
+                self._parse_pool, _parse_page, html_content, url, self._ignored_tags,
+                depth < self.max_depth, (self.exclude_fragments, self.exclude_extensions))
+
+            if self.store_html:
+                page_content['html_path'] = self._save_html(url, html_content)
+            self.stored_urls.add(url)
+            self._out.write(orjson.dumps(page_content) + b'\n')
+            self._out.flush()
+
+            self.pages_processed += 1
+
+            # Atualizar o estado do crawling a cada 10 páginas
+            if self.pages_processed % 10 == 0:
+                self._save_crawl_state()
+                self._save_checkpoint()
+
+            # robots.txt dos hosts envolvidos buscado fora do loop de eventos
+            await self._refresh_robots({_cached_urlparse(link).netloc for link in links}
+                                       | {_cached_urlparse(url).netloc})
+
+            # Adicionar links à fila (vazia se atingimos a profundidade máxima). A fila é
+            # limitada: com o dobro de max_pages já pendente, os demais nunca seriam buscados
+            budget = max(self.max_pages * 2 - self.pages_processed - self.queued_count, 0)
+            for link in itertools.islice(self._filter_links(links), budget):
+                self._enqueue_url(link, depth + 1)
         except Exception as e:
-            logging.error(f"Erro durante o crawling: {str(e)}")
+            logging.error(f"Erro ao processar {url}: {str(e)}")
             logging.error(traceback.format_exc())
-
         finally:
-            # Salvar resultados
-            self.save_to_json()
+            self.in_progress.pop(url, None)
+            async with self._frontier:
+                self._active_workers -= 1
+                self._frontier.notify_all()
 
-            # Limpar recursos
-            self._cleanup_drivers()
+    def _save_html(self, url, html):
+        """
+        Grava o HTML bruto de uma página em um arquivo compactado, fora do registro JSON.
 
-        return self.page_contents
+        Args:
+            url: URL da página
+            html: Conteúdo HTML da página
 
-    def _cleanup_drivers(self):
+        Returns:
+            str: Caminho do arquivo, relativo ao diretório de saída
+        """
+        url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+        html_path = os.path.join('html', f"{url_hash}.html.gz")
+
+        with gzip.open(os.path.join(self.output_dir, html_path), 'wt', encoding='utf-8', compresslevel=1) as f:
+            f.write(html)
+
+        return html_path
+
+    def _save_crawl_state(self):
         """
-        Fecha todos os drivers Selenium.
+        Salva um pequeno resumo do estado do crawling.
+
+        O arquivo é gravado em um temporário e trocado com os.replace, de modo que
+        uma interrupção nunca deixa um estado corrompido.
         """
-        if hasattr(self, 'drivers') and self.drivers:
-            logging.info(f"Fechando {len(self.drivers)} navegadores Selenium")
-            for i, driver in enumerate(self.drivers):
-                try:
-                    driver.quit()
-                    logging.info(f"Navegador #{i + 1} fechado com sucesso")
-                except Exception as e:
-                    logging.warning(f"Erro ao fechar navegador #{i + 1}: {str(e)}")
+        pending = itertools.chain.from_iterable(self.host_queues.values())
+        queue_head = [url for url, _ in itertools.islice(pending, 10)]
+        state = {
+            'domain': self.domain_name,
+            'updated_at': datetime.now().isoformat(),
+            'pages_processed': self.pages_processed,
+            'queued': self.queued_count,
+            'queue_head': queue_head,
+            'pages_file': os.path.basename(self.pages_file)
+        }
+
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, self.state_file)
 
-            self.drivers = []
+        logging.info(f"Estado do crawling salvo em {self.state_file}")
 
-    def _save_intermediate_results(self):
+    def _save_checkpoint(self):
         """
-        Salva os resultados parciais em um arquivo JSON.
+        Salva a fila e as URLs já gravadas para que um crawling interrompido possa ser retomado.
+
+        Páginas em andamento voltam para a fila do checkpoint. O arquivo é gravado
+        em um temporário e trocado com os.replace, como o estado do crawling.
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = os.path.join(self.output_dir, f"crawl_intermediate_{timestamp}.json")
+        pending = itertools.chain.from_iterable(self.host_queues.values())
+        checkpoint = {
+            'stored': self.stored_urls,
+            'queue': list(self.in_progress.items()) + list(pending),
+            'host_last_access': dict(self.host_last_access),
+            'pages_processed': self.pages_processed,
+            'pages_file': os.path.basename(self.pages_file),
+            'pages_offset': os.path.getsize(self.pages_file)
+        }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.page_contents, f, ensure_ascii=False, indent=2)
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(checkpoint, f)
+        os.replace(tmp_file, self.checkpoint_file)
 
-        logging.info(f"Resultados intermediários salvos em {output_file}")
+    def _load_checkpoint(self):
+        """
+        Restaura a fila e as URLs já gravadas de um crawling interrompido.
+
+        Returns:
+            bool: True se um checkpoint foi carregado
+        """
+        try:
+            with open(self.checkpoint_file, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning(f"Erro ao carregar o checkpoint {self.checkpoint_file}: {e}")
+            return False
+
+        # As páginas já salvas precisam continuar no mesmo arquivo para o relatório final
+        pages_file = os.path.join(self.output_dir, checkpoint.get('pages_file', ''))
+        if not os.path.isfile(pages_file):
+            logging.warning(f"Arquivo {pages_file} do checkpoint não encontrado; iniciando um novo crawling")
+            return False
+        self.pages_file = pages_file
+        self._resume_offset = checkpoint['pages_offset']
+
+        self.stored_urls = checkpoint['stored']
+        with _STATE_LOCK:
+            for host, last_access in checkpoint['host_last_access'].items():
+                if last_access > self.host_last_access.get(host, 0):
+                    self.host_last_access[host] = last_access
+        self.pages_processed = checkpoint['pages_processed']
+
+        # Apenas as páginas gravadas contam como visitadas (falhas são tentadas de novo).
+        # Elas também contam como já enfileiradas, que é o que _filter_links verifica
+        for url in self.stored_urls:
+            self.visited_urls.add(url)
+            self.queued_urls.add(url)
+        for url, depth in checkpoint['queue']:
+            self._enqueue_url(url, depth)
+
+        logging.info(f"Retomando crawling de {self.checkpoint_file}: "
+                     f"{self.pages_processed} páginas já salvas, {self.queued_count} URLs na fila")
+        return True
+
+    def _cleanup_drivers(self):
+        """
+        Fecha o navegador Selenium e todas as suas abas.
+        """
+        if getattr(self, 'driver', None):
+            logging.info(f"Fechando navegador Selenium ({len(self.window_handles)} abas)")
+            try:
+                self.driver.quit()
+                logging.info("Navegador fechado com sucesso")
+            except Exception as e:
+                logging.warning(f"Erro ao fechar navegador: {str(e)}")
+
+            self.driver = None
+            self.window_handles = []
 
     def save_to_json(self, filename=None):
         """
         Salva os resultados do crawling em um arquivo JSON.
 
+        As páginas são copiadas linha a linha do arquivo JSONL gravado durante o
+        crawling, já serializadas: nenhuma página é carregada em memória.
+
         Args:
             filename: Nome do arquivo para salvar (opcional)
         """
@@ -785,15 +1748,23 @@ class JSDomainCrawler:
         report = {
             'domain': self.domain_name,
             'crawl_date': datetime.now().isoformat(),
-            'total_pages': len(self.page_contents),
-            'pages': self.page_contents
+            'total_pages': self.pages_processed,
+            'pages_file': os.path.basename(self.pages_file)
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(output_file, 'wb') as f, open(self.pages_file, 'rb') as pages:
+            # Abre a lista 'pages' no fim do objeto e a preenche com as linhas do JSONL
+            f.write(orjson.dumps(report)[:-1] + b',"pages":[')
+            separator = b''
+            for line in pages:
+                line = line.rstrip(b'\n')
+                if line:
+                    f.write(separator + line)
+                    separator = b','
+            f.write(b']}')
 
         logging.info(
-            f"Crawler concluído. {len(self.page_contents)} páginas processadas. Resultados salvos em {output_file}")
+            f"Crawler concluído. {self.pages_processed} páginas processadas. Resultados salvos em {output_file}")
 
         return output_file
 
@@ -805,6 +1776,12 @@ def main():
                         help='Número máximo de páginas para crawlear')
     parser.add_argument('--max-depth', type=int, default=3,
                         help='Profundidade máxima de navegação')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Número de páginas buscadas em paralelo')
+    parser.add_argument('--store-html', action='store_true',
+                        help='Guardar o HTML bruto de cada página em arquivos .html.gz')
+    parser.add_argument('--selenium-only', action='store_true',
+                        help='Renderizar todas as páginas com Selenium, sem tentar requests antes')
     parser.add_argument('--ignored-tags', type=str, default='script,style,meta,link',
                         help='Tags HTML para ignorar, separadas por vírgula')
 
@@ -816,7 +1793,10 @@ def main():
     crawler = JSDomainCrawler(
         domain_name=args.url,
         max_pages=args.max_pages,
-        max_depth=args.max_depth
+        max_depth=args.max_depth,
+        concurrency=args.concurrency,
+        store_html=args.store_html,
+        static_fetch=not args.selenium_only
     )
 
     # Passa as tags a serem ignoradas para o método de extração de conteúdo
@@ -824,7 +1804,10 @@ def main():
         'ignored_tags': ignored_tags
     }
 
-    crawler.crawl()
+    try:
+        asyncio.run(crawler.crawl())
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
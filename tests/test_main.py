@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+import main
+
+
+def _markdown(html):
+    return main._convert_html_to_markdown(BeautifulSoup(html, 'lxml'))
+
+
+class MarkdownListTest(unittest.TestCase):
+    def test_nested_ordered_list_keeps_items_on_their_own_lines(self):
+        html = '<ol><li>a<ol><li>x</li><li>y</li></ol></li><li>b</li></ol>'
+
+        self.assertEqual(_markdown(html), '1. a\n\t1. x\n\t2. y\n2. b')
+
+    def test_nested_unordered_list_is_indented_per_level(self):
+        html = '<ul><li>a <b>b</b><ul><li>x<ol><li>deep</li></ol></li></ul></li><li>z</li></ul>'
+
+        self.assertEqual(_markdown(html), '- a **b**\n\t- x\n\t\t1. deep\n- z')
+
+
+class NormalizeUrlTest(unittest.TestCase):
+    # (base, href, esperado): resultados do urljoin seguido da normalização,
+    # que os atalhos de _normalize_url precisam reproduzir
+    CASES = [
+        ('https://example.com/a/b', '/x', 'https://example.com/x'),
+        ('https://example.com/a/b', 'rel', 'https://example.com/a/rel'),
+        ('https://example.com/a/b/', '../up', 'https://example.com/a/up'),
+        ('https://www.example.com/x?y=1', '?q=1#x', 'https://example.com/x?q=1'),
+        ('http://example.com/dir/page.html', '/a//b/', 'https://example.com/a/b'),
+        ('https://example.com/a/b', '//cdn.example.com/x', 'https://cdn.example.com/x'),
+        ('https://example.com/a/b', 'http://www.example.com/y/', 'https://example.com/y'),
+        ('https://example.com/a/b', '/a/./b', 'https://example.com/a/b'),
+        ('https://example.com/a/b', '/\t../x', 'https://example.com/x'),
+        ('https://example.com/a/b', '/x\n', 'https://example.com/x'),
+        ('https://example.com/a/b', '/path;params?x#y', 'https://example.com/path;params?x'),
+        ('https://example.com/a/b', 'https://example.com', 'https://example.com'),
+        ('https://example.com/a/b', 'https:///path', 'https://example.com/path'),
+        ('https://example.com/a/b', 'https://?q', 'https://example.com/a/b?q'),
+        ('http://example.com/a', 'http:///p', 'https://example.com/p'),
+        ('https://example.com/a/b', 'https://', 'https://example.com/a/b'),
+        ('https://example.com/a/b', 'https://#f', 'https://example.com/a/b'),
+        ('https://example.com/a/b', 'mailto:a@b.c', None),
+        ('https://example.com/a/b', '#top', None),
+    ]
+
+    def test_matches_urljoin_resolution(self):
+        for base, href, expected in self.CASES:
+            with self.subTest(base=base, href=href):
+                self.assertEqual(main._normalize_url(href, base), expected)
+
+    def test_canonicalize_fast_path_matches_full_normalization(self):
+        cases = [
+            ('https://example.com/a', 'https://example.com/a'),
+            ('https://example.com', 'https://example.com'),
+            ('https://example.com/a/', 'https://example.com/a'),
+            ('https://www.example.com/a', 'https://example.com/a'),
+            ('http://example.com/a', 'https://example.com/a'),
+            ('https://example.com//a', 'https://example.com/a'),
+            ('https://example.com/a?', 'https://example.com/a'),
+            ('https://example.com/?q=1', 'https://example.com?q=1'),
+            ('https://example.com/a;p', 'https://example.com/a;p'),
+        ]
+        for url, expected in cases:
+            with self.subTest(url=url):
+                self.assertEqual(main._canonicalize_url(url), expected)
+
+
+class ParsePageTest(unittest.TestCase):
+    HTML = '<html><body><script>track()</script><nav>menu</nav><p>texto</p><a href="/a">a</a></body></html>'
+
+    def test_ignored_tags_as_tuple_are_stripped(self):
+        # crawl() repassa ao pool as tags de _extract_body_content_kwargs
+        links, page = main._parse_page(self.HTML, 'https://example.com/', ('script', 'nav'), True, None)
+
+        self.assertEqual(links, ['https://example.com/a'])
+        self.assertNotIn('track', page['content'])
+        self.assertNotIn('menu', page['content'])
+        self.assertIn('texto', page['content'])
+
+    def test_ignored_tags_as_list_are_stripped(self):
+        links, page = main._parse_page(self.HTML, 'https://example.com/', ['script'], False, None)
+
+        self.assertEqual(links, [])
+        self.assertNotIn('track', page['content'])
+        self.assertIn('menu', page['content'])
+
+
+class CheckpointResumeTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = tmp.name
+        # O navegador não é necessário para salvar e carregar o checkpoint
+        patcher = mock.patch.object(main.JSDomainCrawler, '_initialize_selenium_drivers',
+                                    return_value=(None, []))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _crawler(self):
+        crawler = main.JSDomainCrawler('example.com', delay=0, output_dir=self.output_dir)
+        self.addCleanup(crawler._out.close)
+        return crawler
+
+    def test_resume_filters_stored_links_and_truncates_pages(self):
+        first = self._crawler()
+        (url, _), _ = first._next_url()
+        for page_url in (url, 'https://example.com/a'):
+            first.stored_urls.add(page_url)
+            first._out.write(b'{"url": "%s"}\n' % page_url.encode())
+            first.pages_processed += 1
+        first._enqueue_url('https://example.com/b', 1)
+        first._out.flush()
+        first._save_checkpoint()
+        # Página gravada depois do checkpoint: volta para a fila na retomada
+        first._out.write(b'{"url": "https://example.com/b"}\n')
+        first._out.close()
+
+        resumed = self._crawler()
+
+        self.assertEqual(resumed.pages_file, first.pages_file)
+        self.assertEqual(resumed.pages_processed, 2)
+        with open(resumed.pages_file, 'rb') as f:
+            self.assertEqual(f.read().count(b'\n'), 2)
+        links = ['https://example.com', 'https://example.com/a', 'https://example.com/c']
+        self.assertEqual(list(resumed._filter_links(links)), ['https://example.com/c'])
+        self.assertEqual(resumed._next_url()[0], ('https://example.com/b', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()